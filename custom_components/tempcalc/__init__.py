@@ -1,10 +1,31 @@
 from __future__ import annotations
 
+import re
+from typing import Final
+
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform, __version__ as HA_VERSION
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 
-from .const import DOMAIN, MIN_REQUIRED_HA_VERSION
+from .const import DOMAIN, MIN_REQUIRED_HA_VERSION, MIN_REQUIRED_HA_VERSION_TUPLE
+
+PLATFORMS: Final = (Platform.SENSOR,)
+
+# The HA version cannot change while running, so it is checked once per process
+_VERSION_CHECKED = False
+
+
+def _version_ok(hass_version: str) -> bool:
+    """Return True if the running HA version is supported.
+
+    Compares (year, month, patch) numerically; suffixes like "b1" or ".dev0" are ignored.
+    """
+    parts = [0, 0, 0]
+    for index, part in enumerate(hass_version.split(".")[:3]):
+        digits = re.match(r"\d+", part)
+        parts[index] = int(digits.group()) if digits else 0
+    return tuple(parts) >= MIN_REQUIRED_HA_VERSION_TUPLE
 
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
@@ -14,18 +35,20 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up TempCalc from a config entry."""
+    global _VERSION_CHECKED
 
     # Version check for HA 2025.12+
-    current_version = hass.config.as_dict().get("version")
-    if current_version and current_version < MIN_REQUIRED_HA_VERSION:
-        raise HomeAssistantError(
-            f"TempCalc requires Home Assistant {MIN_REQUIRED_HA_VERSION} or newer."
-        )
+    if not _VERSION_CHECKED:
+        if not _version_ok(HA_VERSION):
+            raise HomeAssistantError(
+                f"TempCalc requires Home Assistant {MIN_REQUIRED_HA_VERSION} or newer."
+            )
+        _VERSION_CHECKED = True
 
     hass.data.setdefault(DOMAIN, {})
 
     # Forward to sensor platform
-    await hass.config_entries.async_forward_entry_setups(entry, ["sensor"])
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     # Enable auto-reload when options change
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
@@ -35,7 +58,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload TempCalc config entry."""
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, ["sensor"])
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id, None)
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import functools
+import re
+from typing import Any
+
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.components.sensor import SensorDeviceClass
+from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers import area_registry as ar, entity_registry as er
 
 from .const import (
@@ -20,141 +25,201 @@ from .const import (
 
 
 # ---------------------------------------------------------
-# Helper functions
+# Detection patterns and constants (built once at import)
 # ---------------------------------------------------------
 
-def _is_plant_sensor(entity_id: str) -> bool:
-    """Exclude plant sensors by name."""
-    name = entity_id.lower()
-    return any(keyword in name for keyword in PLANT_KEYWORDS)
+def _keyword_pattern(keywords) -> re.Pattern[str]:
+    """Compile a keyword list into a single substring-matching regex."""
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
 
 
-def _is_outdoor_sensor(entity_id: str) -> bool:
-    """Detect outdoor sensors by name."""
-    name = entity_id.lower()
-    return any(keyword in name for keyword in OUTDOOR_KEYWORDS)
+_OUTDOOR_RE = _keyword_pattern(OUTDOOR_KEYWORDS)
 
+# Plant sensors and obvious non-climate sensors, matched in one pass
+_EXCLUDE_RE = _keyword_pattern(
+    [
+        *PLANT_KEYWORDS,
+        "energy_", "power", "voltage", "current", "wifi", "mqtt", "connect_count",
+        "backup", "uptime", "runtime",
+    ]
+)
 
-def _is_temperature_sensor(state) -> bool:
-    """Detect real temperature sensors using robust heuristics."""
-    entity_id = state.entity_id.lower()
-    attrs = state.attributes
+# Device classes that may hold indoor/outdoor climate readings
+_CLIMATE_DEVICE_CLASSES = (SensorDeviceClass.TEMPERATURE, SensorDeviceClass.HUMIDITY)
 
-    # Exclude obvious non-climate sensors early
-    if _is_plant_sensor(entity_id):
-        return False
-    if any(x in entity_id for x in ["energy_", "power", "voltage", "current", "wifi", "mqtt", "connect_count"]):
-        return False
-    if any(x in entity_id for x in ["backup", "uptime", "runtime"]):
-        return False
+# Accepted (lowercase) units of measurement
+_TEMP_UNITS = frozenset({"°c", "c", "℃", "celsius", "°f", "f", "fahrenheit"})
+_HUM_UNITS = frozenset({"%", "percent", "rel. %", "rh"})
+
+# Area names treated as outdoor
+_OUTDOOR_AREA_RE = _keyword_pattern(["balkon", "balkony", "garten", "garden", "terrasse", "terrace", "outdoor"])
+
+# Name heuristics, used when the unit is missing
+_TEMP_NAME_RE = _keyword_pattern(["temp", "temperatur", "temperature", "t_"])
+_HUM_NAME_RE = _keyword_pattern(["hum", "humidity", "feuchte", "r_h", "rh"])
+
+# Above this many sensor states, classification runs in the executor
+_EXECUTOR_THRESHOLD = 500
+
+
+# ---------------------------------------------------------
+# Helper functions
+# ---------------------------------------------------------
+
+# Name predicates expect a lowercase name. entity_ids taken from hass.states
+# are always lowercase (HA rejects anything else), so they are passed as-is.
+
+def _is_outdoor_sensor(name: str) -> bool:
+    """Detect outdoor sensors by (lowercase) name."""
+    return bool(_OUTDOOR_RE.search(name))
 
-    # Must be numeric
-    try:
-        val = float(str(state.state).replace(",", "."))
-    except Exception:
-        return False
 
+def _is_excluded_sensor(name: str) -> bool:
+    """Exclude plant sensors and obvious non-climate sensors by (lowercase) name."""
+    return bool(_EXCLUDE_RE.search(name))
+
+
+def _is_temperature_sensor(name: str, val: float, unit: str) -> bool:
+    """Detect real temperature sensors using robust heuristics."""
     # Plausible range
     if not (-40.0 <= val <= 80.0):
         return False
 
     # Unit check
-    unit = str(attrs.get("unit_of_measurement", "")).lower().strip()
-    if unit in ["°c", "c", "℃", "celsius", "°f", "f", "fahrenheit"]:
+    if unit in _TEMP_UNITS:
         return True
 
     # Name heuristics – only if unit missing
-    if any(x in entity_id for x in ["temp", "temperatur", "temperature", "t_"]):
+    if _TEMP_NAME_RE.search(name):
         return True
 
     return False
 
 
-def _is_humidity_sensor(state) -> bool:
+def _is_humidity_sensor(name: str, val: float, unit: str) -> bool:
     """Detect real humidity sensors using robust heuristics."""
-    entity_id = state.entity_id.lower()
-    attrs = state.attributes
-
-    if _is_plant_sensor(entity_id):
-        return False
-    if any(x in entity_id for x in ["energy_", "power", "voltage", "current", "wifi", "mqtt", "connect_count"]):
-        return False
-    if any(x in entity_id for x in ["backup", "uptime", "runtime"]):
-        return False
-
-    # Must be numeric
-    try:
-        val = float(str(state.state).replace(",", "."))
-    except Exception:
-        return False
-
     # Plausible range
     if not (0.0 <= val <= 100.0):
         return False
 
     # Unit check
-    unit = str(attrs.get("unit_of_measurement", "")).lower().strip()
-    if unit in ["%", "percent", "rel. %", "rh"]:
+    if unit in _HUM_UNITS:
         return True
 
     # Name heuristics – only wenn Einheit fehlt
-    if any(x in entity_id for x in ["hum", "humidity", "feuchte", "r_h", "rh"]):
+    if _HUM_NAME_RE.search(name):
         return True
 
     return False
 
 
+def _classify_states(
+    states: list[State],
+) -> tuple[list[tuple[str, str]], list[tuple[str, str]]]:
+    """Return (temperature, humidity) sensors in a single pass over the states.
+
+    Each sensor is an (entity_id, lowercase friendly name) pair, so the text
+    filter does not have to look the state up again. Pure function of the
+    given states, so it is safe to run in the executor.
+    """
+    temp_sensors: list[tuple[str, str]] = []
+    hum_sensors: list[tuple[str, str]] = []
+
+    for state in states:
+        entity_id = state.entity_id
+
+        # Exclude obvious non-climate sensors early
+        if _is_excluded_sensor(entity_id):
+            continue
+
+        # A declared device class decides before any other heuristic
+        attrs = state.attributes
+        device_class = attrs.get("device_class")
+        if device_class and device_class not in _CLIMATE_DEVICE_CLASSES:
+            continue
+
+        # Must be numeric (decimal comma only as fallback)
+        state_str = state.state
+        try:
+            val = float(state_str)
+        except (TypeError, ValueError):
+            try:
+                val = float(str(state_str).replace(",", "."))
+            except (TypeError, ValueError):
+                continue
+
+        unit = str(attrs.get("unit_of_measurement", "")).lower().strip()
+
+        is_temp = device_class != SensorDeviceClass.HUMIDITY and _is_temperature_sensor(entity_id, val, unit)
+        is_hum = device_class != SensorDeviceClass.TEMPERATURE and _is_humidity_sensor(entity_id, val, unit)
+        if not (is_temp or is_hum):
+            continue
+
+        sensor = (entity_id, str(attrs.get("friendly_name", "")).lower())
+        if is_temp:
+            temp_sensors.append(sensor)
+        if is_hum:
+            hum_sensors.append(sensor)
+
+    return temp_sensors, hum_sensors
+
+
+def _classify_sensors(
+    hass: HomeAssistant,
+) -> tuple[list[tuple[str, str]], list[tuple[str, str]]]:
+    """Classify all sensor states inline."""
+    return _classify_states(hass.states.async_all("sensor"))
+
+
+async def _async_classify_sensors(
+    hass: HomeAssistant,
+) -> tuple[list[tuple[str, str]], list[tuple[str, str]]]:
+    """Classify all sensor states, in the executor on large installations."""
+    states = hass.states.async_all("sensor")
+    if len(states) > _EXECUTOR_THRESHOLD:
+        return await hass.async_add_executor_job(_classify_states, states)
+    return _classify_states(states)
+
+
 def _filter_by_area_and_text(
     hass: HomeAssistant,
-    entity_ids: list[str],
+    sensors: list[tuple[str, str]],
     area_name: str | None,
     text_filter: str | None,
 ) -> list[str]:
-    """Optional filter by area name and free text."""
-    if not entity_ids:
+    """Optional filter by area name and free text.
+
+    Takes (entity_id, lowercase friendly name) pairs from the classifier and
+    returns the matching entity_ids.
+    """
+    if not sensors:
         return []
 
     area_name = (area_name or "").strip().lower()
     text_filter = (text_filter or "").strip().lower()
 
     if not area_name and not text_filter:
-        return entity_ids
+        return [eid for eid, _ in sensors]
 
-    area_reg = ar.async_get(hass)
-    ent_reg = er.async_get(hass)
-
-    # Resolve area name -> area_id
-    area_id = None
+    # Area filter: resolve area name -> area_id, then keep entities registered there
     if area_name:
+        area_reg = ar.async_get(hass)
+        area_id = None
         for area in area_reg.areas.values():
             if area.name.lower() == area_name:
                 area_id = area.id
                 break
 
-    result: list[str] = []
-
-    for eid in entity_ids:
-        eid_l = eid.lower()
-
-        # Text filter
-        if text_filter and text_filter not in eid_l:
-            # Try friendly name
-            state = hass.states.get(eid)
-            friendly = (state and str(state.attributes.get("friendly_name", "")).lower()) or ""
-            if text_filter not in friendly:
-                continue
-
-        # Area filter
         if area_id:
-            ent_entry = ent_reg.async_get(eid)
-            if not ent_entry:
-                continue
-            if ent_entry.area_id != area_id:
-                continue
+            ent_reg = er.async_get(hass)
+            eids_in_area = {entry.entity_id for entry in er.async_entries_for_area(ent_reg, area_id)}
+            sensors = [sensor for sensor in sensors if sensor[0] in eids_in_area]
 
-        result.append(eid)
+    if not text_filter:
+        return [eid for eid, _ in sensors]
 
-    return result
+    # Text filter on entity_id, then friendly name
+    return [eid for eid, friendly in sensors if text_filter in eid or text_filter in friendly]
 
 
 def _get_temperature_sensors(
@@ -163,12 +228,8 @@ def _get_temperature_sensors(
     text_filter: str | None = None,
 ) -> list[str]:
     """Return temperature sensors, optionally filtered by area/text."""
-    sensors: list[str] = []
-    for state in hass.states.async_all("sensor"):
-        if _is_temperature_sensor(state):
-            sensors.append(state.entity_id)
-
-    return _filter_by_area_and_text(hass, sensors, area_name, text_filter)
+    temp_sensors, _ = _classify_sensors(hass)
+    return _filter_by_area_and_text(hass, temp_sensors, area_name, text_filter)
 
 
 def _get_humidity_sensors(
@@ -177,45 +238,60 @@ def _get_humidity_sensors(
     text_filter: str | None = None,
 ) -> list[str]:
     """Return humidity sensors, optionally filtered by area/text."""
-    sensors: list[str] = []
-    for state in hass.states.async_all("sensor"):
-        if _is_humidity_sensor(state):
-            sensors.append(state.entity_id)
+    _, hum_sensors = _classify_sensors(hass)
+    return _filter_by_area_and_text(hass, hum_sensors, area_name, text_filter)
+
+
+async def _async_get_sensor_lists(
+    hass: HomeAssistant,
+    area_name: str | None = None,
+    text_filter: str | None = None,
+) -> tuple[list[str], list[str]]:
+    """Return (temperature, humidity) sensors for a form, classified once.
 
-    return _filter_by_area_and_text(hass, sensors, area_name, text_filter)
+    Falls back to the unfiltered lists if the area/text filter is too strict.
+    """
+    all_temp, all_hum = await _async_classify_sensors(hass)
+
+    temp_sensors = _filter_by_area_and_text(hass, all_temp, area_name, text_filter)
+    hum_sensors = _filter_by_area_and_text(hass, all_hum, area_name, text_filter)
+
+    return (
+        temp_sensors or [eid for eid, _ in all_temp],
+        hum_sensors or [eid for eid, _ in all_hum],
+    )
 
 
 def _guess_best_outdoor(
     hass: HomeAssistant,
     candidates: list[str],
+    outdoor_area_ids: frozenset[str],
 ) -> str | None:
-    """Guess the best outdoor sensor among candidates."""
-    if not candidates:
-        return None
-
-    # 1. Name heuristics (balkon, garten, outdoor, terrace, etc.)
-    outdoor_like = [eid for eid in candidates if _is_outdoor_sensor(eid)]
+    """Guess the best outdoor sensor among candidates, None if nothing looks outdoor."""
+    # 1. Name heuristics (balkon, garten, outdoor, terrace, etc.) – first match wins
+    outdoor_like = next((eid for eid in candidates if _is_outdoor_sensor(eid)), None)
     if outdoor_like:
-        return outdoor_like[0]
+        return outdoor_like
 
     # 2. Area heuristics (areas mit typischen Namen)
-    area_reg = ar.async_get(hass)
-    ent_reg = er.async_get(hass)
-
-    outdoor_area_ids = {
-        area.id
-        for area in area_reg.areas.values()
-        if any(x in area.name.lower() for x in ["balkon", "balkony", "garten", "garden", "terrasse", "terrace", "outdoor"])
-    }
-
     if outdoor_area_ids:
+        ent_reg = er.async_get(hass)
         for eid in candidates:
             ent = ent_reg.async_get(eid)
             if ent and ent.area_id in outdoor_area_ids:
                 return eid
 
-    # 3. Fallback: first candidate
-    return candidates[0]
+    return None
+
+
+def _get_outdoor_area_ids(hass: HomeAssistant) -> frozenset[str]:
+    """Return ids of areas with typical outdoor names."""
+    area_reg = ar.async_get(hass)
+    return frozenset(
+        area.id
+        for area in area_reg.areas.values()
+        if area.name and _OUTDOOR_AREA_RE.search(area.name.lower())
+    )
 
 
 def _get_area_names(hass: HomeAssistant) -> list[str]:
@@ -225,6 +301,115 @@ def _get_area_names(hass: HomeAssistant) -> list[str]:
     return names
 
 
+# ---------------------------------------------------------
+# Form schema
+# ---------------------------------------------------------
+
+# Calculation toggles and their defaults (form order)
+_CALCULATION_DEFAULTS: dict[str, bool] = {
+    "enable_absolute_humidity": DEFAULT_ENABLE_ABSOLUTE_HUMIDITY,
+    "enable_mold_index": DEFAULT_ENABLE_MOLD_INDEX,
+    "enable_dew_point": DEFAULT_ENABLE_DEW_POINT,
+    "enable_enthalpy": DEFAULT_ENABLE_ENTHALPY,
+    "enable_ventilation_recommendation": DEFAULT_ENABLE_VENTILATION_RECOMMENDATION,
+    "enable_ventilation_duration": DEFAULT_ENABLE_VENTILATION_DURATION,
+}
+
+
+def _calculation_fields(values: dict) -> dict:
+    """Return the calculation toggles, defaulting to the given values."""
+    return {
+        vol.Optional(key, default=values.get(key, default)): bool
+        for key, default in _CALCULATION_DEFAULTS.items()
+    }
+
+
+# Built once; used whenever no calculation option has been set yet
+_STATIC_SCHEMA_FIELDS = _calculation_fields({})
+
+
+# Form keys whose current value becomes the field default
+_SCHEMA_VALUE_KEYS = (
+    "room_name",
+    "room_area",
+    "room_filter",
+    "indoor_temperature_sensor",
+    "indoor_humidity_sensor",
+    "outdoor_temperature_sensor",
+    "outdoor_humidity_sensor",
+    *_CALCULATION_DEFAULTS,
+)
+
+
+def _form_schema(
+    values: dict,
+    temp_sensors: list[str],
+    hum_sensors: list[str],
+    area_options: list[str],
+    best_outdoor_temp: str | None,
+    best_outdoor_hum: str | None,
+) -> vol.Schema:
+    """Return the setup/options form schema for the current values."""
+    defaults = tuple((key, values[key]) for key in _SCHEMA_VALUE_KEYS if key in values)
+    return _build_schema(
+        defaults,
+        tuple(temp_sensors),
+        tuple(hum_sensors),
+        tuple(area_options),
+        best_outdoor_temp,
+        best_outdoor_hum,
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _build_schema(
+    defaults: tuple[tuple[str, Any], ...],
+    temp_sensors: tuple[str, ...],
+    hum_sensors: tuple[str, ...],
+    area_options: tuple[str, ...],
+    best_outdoor_temp: str | None,
+    best_outdoor_hum: str | None,
+) -> vol.Schema:
+    """Build the form schema; cached, so unchanged re-renders reuse it."""
+    values = dict(defaults)
+    if any(key in values for key in _CALCULATION_DEFAULTS):
+        calculation_fields = _calculation_fields(values)
+    else:
+        calculation_fields = _STATIC_SCHEMA_FIELDS
+
+    return vol.Schema(
+        {
+            # Raum / Filter / Name
+            vol.Optional("room_name", default=values.get("room_name", "")): str,
+            vol.Optional("room_area", default=values.get("room_area", "")): vol.In(area_options),
+            vol.Optional("room_filter", default=values.get("room_filter", "")): str,
+
+            # Innensensoren
+            vol.Required(
+                "indoor_temperature_sensor",
+                default=values.get("indoor_temperature_sensor", temp_sensors[0] if temp_sensors else ""),
+            ): vol.In(temp_sensors),
+            vol.Required(
+                "indoor_humidity_sensor",
+                default=values.get("indoor_humidity_sensor", hum_sensors[0] if hum_sensors else ""),
+            ): vol.In(hum_sensors),
+
+            # Außensensoren – manuell überschreibbar
+            vol.Optional(
+                "outdoor_temperature_sensor",
+                default=values.get("outdoor_temperature_sensor", best_outdoor_temp or ""),
+            ): str,
+            vol.Optional(
+                "outdoor_humidity_sensor",
+                default=values.get("outdoor_humidity_sensor", best_outdoor_hum or ""),
+            ): str,
+
+            # Berechnungen
+            **calculation_fields,
+        }
+    )
+
+
 # ---------------------------------------------------------
 # Config Flow
 # ---------------------------------------------------------
@@ -234,12 +419,63 @@ class TempCalcConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    def __init__(self) -> None:
+        """Initialize the flow."""
+        # (area, text filter) -> (temp sensors, hum sensors, best outdoor temp, best outdoor hum)
+        self._sensor_cache: dict[
+            tuple[str, str], tuple[list[str], list[str], str | None, str | None]
+        ] = {}
+        self._area_names: list[str] | None = None
+        self._outdoor_area_ids: frozenset[str] | None = None
+
+    def _clear_caches(self) -> None:
+        """Forget sensor and area lookups from a previous visit of the step."""
+        self._sensor_cache.clear()
+        self._area_names = None
+        self._outdoor_area_ids = None
+
+    async def _async_sensor_selection(
+        self, room_area: str, room_filter: str
+    ) -> tuple[list[str], list[str], str | None, str | None]:
+        """Return sensor lists and outdoor guesses for the form.
+
+        Only recomputed when room area or filter change, so toggling a
+        calculation option re-renders without scanning all states again.
+        """
+        key = (room_area, room_filter)
+        if key not in self._sensor_cache:
+            # Get sensors with optional filter (area/text); falls back to all if filter zu streng
+            temp_sensors, hum_sensors = await _async_get_sensor_lists(
+                self.hass, area_name=room_area or None, text_filter=room_filter or None
+            )
+
+            # Auto-detect outdoor sensors
+            outdoor_area_ids = self._cached_outdoor_area_ids()
+            best_outdoor_temp = _guess_best_outdoor(self.hass, temp_sensors, outdoor_area_ids)
+            best_outdoor_hum = _guess_best_outdoor(self.hass, hum_sensors, outdoor_area_ids)
+
+            self._sensor_cache[key] = (temp_sensors, hum_sensors, best_outdoor_temp, best_outdoor_hum)
+        return self._sensor_cache[key]
+
+    def _cached_area_names(self) -> list[str]:
+        """Return all area names, looked up once per flow."""
+        if self._area_names is None:
+            self._area_names = _get_area_names(self.hass)
+        return self._area_names
+
+    def _cached_outdoor_area_ids(self) -> frozenset[str]:
+        """Return outdoor area ids, looked up once per flow."""
+        if self._outdoor_area_ids is None:
+            self._outdoor_area_ids = _get_outdoor_area_ids(self.hass)
+        return self._outdoor_area_ids
+
     async def async_step_user(self, user_input=None):
         """Initial setup step."""
         errors: dict[str, str] = {}
 
         # First call: no input yet -> just show form
         if user_input is None:
+            self._clear_caches()
             return await self._show_user_form()
 
         # On submit: basic validation – if something fundamental fehlt, zeig das Formular erneut
@@ -267,92 +503,22 @@ class TempCalcConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         room_area = user_input.get("room_area", "")
         room_filter = user_input.get("room_filter", "")
 
-        # Get sensors with optional filter (area/text)
-        temp_sensors = _get_temperature_sensors(self.hass, area_name=room_area or None, text_filter=room_filter or None)
-        hum_sensors = _get_humidity_sensors(self.hass, area_name=room_area or None, text_filter=room_filter or None)
-
-        # Fallback: if filter zu streng, nimm alle
-        if not temp_sensors:
-            temp_sensors = _get_temperature_sensors(self.hass)
-        if not hum_sensors:
-            hum_sensors = _get_humidity_sensors(self.hass)
-
-        # Auto-detect outdoor sensors
-        outdoor_temp_candidates = [s for s in temp_sensors if _is_outdoor_sensor(s)]
-        outdoor_hum_candidates = [s for s in hum_sensors if _is_outdoor_sensor(s)]
-
-        best_outdoor_temp = _guess_best_outdoor(self.hass, outdoor_temp_candidates) if outdoor_temp_candidates else None
-        best_outdoor_hum = _guess_best_outdoor(self.hass, outdoor_hum_candidates) if outdoor_hum_candidates else None
+        # Sensors (area/text filtered) and auto-detected outdoor sensors
+        temp_sensors, hum_sensors, best_outdoor_temp, best_outdoor_hum = await self._async_sensor_selection(
+            room_area, room_filter
+        )
 
         # Area list for dropdown
-        areas = _get_area_names(self.hass)
+        areas = self._cached_area_names()
         area_options = [""] + areas  # "" = keine Auswahl
 
-        schema = vol.Schema(
-            {
-                # Raum / Filter / Name
-                vol.Optional("room_name", default=user_input.get("room_name", "")): str,
-                vol.Optional("room_area", default=user_input.get("room_area", "")): vol.In(area_options),
-                vol.Optional("room_filter", default=user_input.get("room_filter", "")): str,
-
-                # Innensensoren
-                vol.Required(
-                    "indoor_temperature_sensor",
-                    default=user_input.get("indoor_temperature_sensor", temp_sensors[0] if temp_sensors else ""),
-                ): vol.In(temp_sensors),
-                vol.Required(
-                    "indoor_humidity_sensor",
-                    default=user_input.get("indoor_humidity_sensor", hum_sensors[0] if hum_sensors else ""),
-                ): vol.In(hum_sensors),
-
-                # Außensensoren – manuell überschreibbar
-                vol.Optional(
-                    "outdoor_temperature_sensor",
-                    default=user_input.get(
-                        "outdoor_temperature_sensor",
-                        best_outdoor_temp or "",
-                    ),
-                ): str,
-                vol.Optional(
-                    "outdoor_humidity_sensor",
-                    default=user_input.get(
-                        "outdoor_humidity_sensor",
-                        best_outdoor_hum or "",
-                    ),
-                ): str,
-
-                # Berechnungen
-                vol.Optional(
-                    "enable_absolute_humidity",
-                    default=user_input.get("enable_absolute_humidity", DEFAULT_ENABLE_ABSOLUTE_HUMIDITY),
-                ): bool,
-                vol.Optional(
-                    "enable_mold_index",
-                    default=user_input.get("enable_mold_index", DEFAULT_ENABLE_MOLD_INDEX),
-                ): bool,
-                vol.Optional(
-                    "enable_dew_point",
-                    default=user_input.get("enable_dew_point", DEFAULT_ENABLE_DEW_POINT),
-                ): bool,
-                vol.Optional(
-                    "enable_enthalpy",
-                    default=user_input.get("enable_enthalpy", DEFAULT_ENABLE_ENTHALPY),
-                ): bool,
-                vol.Optional(
-                    "enable_ventilation_recommendation",
-                    default=user_input.get(
-                        "enable_ventilation_recommendation",
-                        DEFAULT_ENABLE_VENTILATION_RECOMMENDATION,
-                    ),
-                ): bool,
-                vol.Optional(
-                    "enable_ventilation_duration",
-                    default=user_input.get(
-                        "enable_ventilation_duration",
-                        DEFAULT_ENABLE_VENTILATION_DURATION,
-                    ),
-                ): bool,
-            }
+        schema = _form_schema(
+            user_input,
+            temp_sensors,
+            hum_sensors,
+            area_options,
+            best_outdoor_temp,
+            best_outdoor_hum,
         )
 
         return self.async_show_form(
@@ -365,7 +531,9 @@ class TempCalcConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Options flow to adjust sensors and calculations later."""
         errors: dict[str, str] = {}
 
-        if user_input is not None:
+        if user_input is None:
+            self._clear_caches()
+        else:
             # Minimal validation
             if not user_input.get("indoor_temperature_sensor"):
                 errors["indoor_temperature_sensor"] = "required"
@@ -389,90 +557,20 @@ class TempCalcConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         room_area = current.get("room_area", "")
         room_filter = current.get("room_filter", "")
 
-        temp_sensors = _get_temperature_sensors(self.hass, area_name=room_area or None, text_filter=room_filter or None)
-        hum_sensors = _get_humidity_sensors(self.hass, area_name=room_area or None, text_filter=room_filter or None)
-
-        if not temp_sensors:
-            temp_sensors = _get_temperature_sensors(self.hass)
-        if not hum_sensors:
-            hum_sensors = _get_humidity_sensors(self.hass)
-
-        outdoor_temp_candidates = [s for s in temp_sensors if _is_outdoor_sensor(s)]
-        outdoor_hum_candidates = [s for s in hum_sensors if _is_outdoor_sensor(s)]
-
-        best_outdoor_temp = _guess_best_outdoor(self.hass, outdoor_temp_candidates) if outdoor_temp_candidates else None
-        best_outdoor_hum = _guess_best_outdoor(self.hass, outdoor_hum_candidates) if outdoor_hum_candidates else None
+        temp_sensors, hum_sensors, best_outdoor_temp, best_outdoor_hum = await self._async_sensor_selection(
+            room_area, room_filter
+        )
 
-        areas = _get_area_names(self.hass)
+        areas = self._cached_area_names()
         area_options = [""] + areas
 
-        schema = vol.Schema(
-            {
-                vol.Optional("room_name", default=current.get("room_name", "")): str,
-                vol.Optional("room_area", default=current.get("room_area", "")): vol.In(area_options),
-                vol.Optional("room_filter", default=current.get("room_filter", "")): str,
-
-                vol.Required(
-                    "indoor_temperature_sensor",
-                    default=current.get(
-                        "indoor_temperature_sensor",
-                        temp_sensors[0] if temp_sensors else "",
-                    ),
-                ): vol.In(temp_sensors),
-                vol.Required(
-                    "indoor_humidity_sensor",
-                    default=current.get(
-                        "indoor_humidity_sensor",
-                        hum_sensors[0] if hum_sensors else "",
-                    ),
-                ): vol.In(hum_sensors),
-
-                vol.Optional(
-                    "outdoor_temperature_sensor",
-                    default=current.get(
-                        "outdoor_temperature_sensor",
-                        best_outdoor_temp or "",
-                    ),
-                ): str,
-                vol.Optional(
-                    "outdoor_humidity_sensor",
-                    default=current.get(
-                        "outdoor_humidity_sensor",
-                        best_outdoor_hum or "",
-                    ),
-                ): str,
-
-                vol.Optional(
-                    "enable_absolute_humidity",
-                    default=current.get("enable_absolute_humidity", DEFAULT_ENABLE_ABSOLUTE_HUMIDITY),
-                ): bool,
-                vol.Optional(
-                    "enable_mold_index",
-                    default=current.get("enable_mold_index", DEFAULT_ENABLE_MOLD_INDEX),
-                ): bool,
-                vol.Optional(
-                    "enable_dew_point",
-                    default=current.get("enable_dew_point", DEFAULT_ENABLE_DEW_POINT),
-                ): bool,
-                vol.Optional(
-                    "enable_enthalpy",
-                    default=current.get("enable_enthalpy", DEFAULT_ENABLE_ENTHALPY),
-                ): bool,
-                vol.Optional(
-                    "enable_ventilation_recommendation",
-                    default=current.get(
-                        "enable_ventilation_recommendation",
-                        DEFAULT_ENABLE_VENTILATION_RECOMMENDATION,
-                    ),
-                ): bool,
-                vol.Optional(
-                    "enable_ventilation_duration",
-                    default=current.get(
-                        "enable_ventilation_duration",
-                        DEFAULT_ENABLE_VENTILATION_DURATION,
-                    ),
-                ): bool,
-            }
+        schema = _form_schema(
+            current,
+            temp_sensors,
+            hum_sensors,
+            area_options,
+            best_outdoor_temp,
+            best_outdoor_hum,
         )
 
         return self.async_show_form(
@@ -1,34 +1,46 @@
+import sys
+from typing import Final
+
 DOMAIN = "tempcalc"
 
+# Keyword lists are lowercased and interned at import, so matching only
+# has to lowercase the entity name
+
 # Keywords to detect plant sensors (to exclude them)
-PLANT_KEYWORDS = [
-    "plant",
-    "pflanze",
-    "flora",
-    "flower",
-    "soil",
-    "moisture",
-    "boden",
-    "erde"
-]
+PLANT_KEYWORDS = tuple(
+    sys.intern(keyword.lower())
+    for keyword in (
+        "plant",
+        "pflanze",
+        "flora",
+        "flower",
+        "soil",
+        "moisture",
+        "boden",
+        "erde",
+    )
+)
 
 # Keywords to detect outdoor sensors (Option C)
-OUTDOOR_KEYWORDS = [
-    "outdoor",
-    "outside",
-    "aussen",
-    "außen",
-    "balkon",
-    "garten",
-    "terrasse",
-    "yard",
-    "porch",
-    "veranda"
-]
+OUTDOOR_KEYWORDS = tuple(
+    sys.intern(keyword.lower())
+    for keyword in (
+        "outdoor",
+        "outside",
+        "aussen",
+        "außen",
+        "balkon",
+        "garten",
+        "terrasse",
+        "yard",
+        "porch",
+        "veranda",
+    )
+)
 
 # Mold index boundaries
-MOLD_INDEX_MIN = 0.0
-MOLD_INDEX_MAX = 6.0
+MOLD_INDEX_MIN: Final[float] = 0.0
+MOLD_INDEX_MAX: Final[float] = 6.0
 
 # Default option values
 DEFAULT_ENABLE_ABSOLUTE_HUMIDITY = True
@@ -39,8 +51,9 @@ DEFAULT_ENABLE_VENTILATION_RECOMMENDATION = True
 DEFAULT_ENABLE_VENTILATION_DURATION = True
 
 # Temperature safety thresholds (winter protection)
-MIN_INDOOR_TEMP = 18.0
-MAX_TEMP_DROP = 1.5
+MIN_INDOOR_TEMP: Final[float] = 18.0
+MAX_TEMP_DROP: Final[float] = 1.5
 
 # HA 2025.12 compatibility
 MIN_REQUIRED_HA_VERSION = "2025.12.0"
+MIN_REQUIRED_HA_VERSION_TUPLE: Final = (2025, 12, 0)